@@ -1,3 +1,5 @@
+from collections import Counter
+from operator import sub
 from pathlib import Path
 
 def part_one(values_first_column, values_second_column):
@@ -13,9 +15,9 @@ def part_one(values_first_column, values_second_column):
     - int: The sum of the absolute differences between corresponding elements.
     """
     # Calculate the absolute difference for each pair of corresponding elements
-    # and sum them up. Using zip allows us to iterate over both lists in parallel.
-    differences = [abs(b - a) for a, b in zip(values_first_column, values_second_column)]
-    return sum(differences)
+    # and sum them up. Chaining map over operator.sub and abs keeps the whole
+    # pass in C instead of building an intermediate list in a comprehension.
+    return sum(map(abs, map(sub, values_second_column, values_first_column)))
 
 
 def part_two(values_first_column, values_second_column):
@@ -31,14 +33,10 @@ def part_two(values_first_column, values_second_column):
     Returns:
     - int: The sum of each element multiplied by its frequency of occurrence in the second list.
     """
-    # For each element in the first list, count how many times it appears in the second list.
-    # Multiply the element by its occurrence count and add these values together.
-    total_weighted_occurrences = 0
-    for value in values_first_column:
-        occurrence_count = values_second_column.count(value)
-        total_weighted_occurrences += occurrence_count * value
-
-    return total_weighted_occurrences
+    # Count every value in the second list once, then weight each element of the
+    # first list by its count. Counter returns 0 for values it has never seen.
+    occurrence_counts = Counter(values_second_column)
+    return sum(value * occurrence_counts[value] for value in values_first_column)
 
 
 def main():
@@ -50,26 +48,19 @@ def main():
         2 5
         4 4
 
-    Each line is read, and the first integer goes into 'values_first_column' 
-    and the second integer goes into 'values_second_column'.
+    The whole file is tokenized in one pass; even-indexed integers go into
+    'values_first_column' and odd-indexed integers into 'values_second_column'.
 
     After reading, both lists are sorted and then processed by 'part_one' and 'part_two'.
     """
     project_directory = Path(__file__).parent
-    values_first_column = []
-    values_second_column = []
-
-    # Read data from input file
-    with open(project_directory / 'input.txt', 'r') as file:
-        for line in file:
-            # Split line into two integers and append to respective lists
-            first_val_str, second_val_str = line.split()
-            values_first_column.append(int(first_val_str))
-            values_second_column.append(int(second_val_str))
-
-    # Sort the input lists
-    values_first_column.sort()
-    values_second_column.sort()
+
+    # Read data from input file and split every whitespace-separated token at once
+    values = list(map(int, (project_directory / 'input.txt').read_bytes().split()))
+
+    # Deinterleave the two columns and sort them
+    values_first_column = sorted(values[0::2])
+    values_second_column = sorted(values[1::2])
 
     # Compute results
     result_part_one = part_one(values_first_column, values_second_column)
@@ -1,3 +1,4 @@
+from itertools import islice
 from pathlib import Path
 
 def is_safe(lst):
@@ -5,22 +6,40 @@ def is_safe(lst):
     #
     # Part 1 of the puzzle:
     # - The report (list of levels) must be strictly increasing or strictly decreasing.
-    #   This means when sorted, the list must match either the original list (already ascending)
-    #   or the reversed original list (already descending).
     # - Any two adjacent levels must differ by at least 1 and at most 3.
     #
-    # 1. Check if the list is sorted ascending or exactly sorted descending.
-    #    If sorted(lst) == lst, it's ascending.
-    #    If sorted(lst) == lst[::-1], it's descending.
-    #    Otherwise, it's not strictly one direction.
+    # Both rules can be checked in a single pass over adjacent pairs (a, b):
+    # 1. The first pair fixes the direction: +1 if increasing, -1 otherwise.
+    # 2. The report is safe if every difference b - a, multiplied by that
+    #    direction, lies in [1, 3].
     #
-    # 2. Check all adjacent differences: For each pair of consecutive levels (a, b),
-    #    verify that 1 <= abs(a - b) <= 3.
+    # This avoids sorting, reversing, or slicing the list, so no throwaway lists
+    # are built even though this runs once per candidate removal in Part 2.
+
+    if len(lst) < 2:
+        return True
+    direction = 1 if lst[1] > lst[0] else -1
+    return all(1 <= (b - a) * direction <= 3 for a, b in zip(lst, islice(lst, 1, None)))
+
+
+def is_safe_with_dampener(lst):
+    # Checks if a report can be made safe by removing at most one level (Part 2).
     #
-    # If both checks pass, return True; otherwise, return False.
+    # Instead of trying every possible removal, look at each direction separately
+    # (increasing, then decreasing) and find the first adjacent pair (i, i+1) that
+    # breaks the rule for that direction. Every pair before it is already fine, and
+    # the bad pair survives any removal other than one of its own two levels, so
+    # only removing index i or index i+1 can possibly fix the report.
 
-    return sorted(lst) in [lst, lst[::-1]] \
-       and all(1 <= abs(a-b) <= 3 for a, b in zip(lst, lst[1:]))
+    diffs = [b - a for a, b in zip(lst, lst[1:])]
+    for low, high in ((1, 3), (-3, -1)):
+        first_bad = next((i for i, d in enumerate(diffs) if not low <= d <= high), None)
+        if first_bad is None:
+            return True
+        for i in (first_bad, first_bad + 1):
+            if is_safe(lst[:i] + lst[i+1:]):
+                return True
+    return False
 
 
 def main():
@@ -46,8 +65,8 @@ def main():
       If it is, increment full_safe (the count of reports that need no modification).
     - If it's not safe under the original rules, check if removing one level 
       could make it safe (Part 2 scenario). 
-      For each position in the list, try removing that level and check again if the resulting
-      list is safe. If yes for any removal, increment one_bad_level_safe.
+      Only the two levels of the first offending pair need to be tried for each
+      direction. If either removal is safe, increment one_bad_level_safe.
     
     In the end:
     - Part 1 safe count = Number of reports safe without any removal.
@@ -60,9 +79,10 @@ def main():
     PROJECT_DIR = Path(__file__).parent
 
     full_safe, one_bad_level_safe = 0, 0
-    for line in open(PROJECT_DIR/'input.txt'):
+    # Read the whole file at once and split it into reports in C.
+    for line in (PROJECT_DIR/'input.txt').read_bytes().splitlines():
         # Convert each line into a list of integers representing levels in the report.
-        data = [int(x) for x in line.split()]
+        data = list(map(int, line.split()))
 
         # Check if the report is safe under the original rules (no removals).
         if is_safe(data):
@@ -71,7 +91,7 @@ def main():
             # If not safe, check if removing one level can make it safe.
             # The Problem Dampener allows for one problematic level to be removed.
             # If after removing one level the report becomes safe, then count it in one_bad_level_safe.
-            if any(is_safe(data[:i] + data[i+1:]) for i in range(len(data))):
+            if is_safe_with_dampener(data):
                 one_bad_level_safe += 1
 
     # Part 1 safe: reports that were safe without modifications.
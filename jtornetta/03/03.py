@@ -1,38 +1,16 @@
 from pathlib import Path
 import re
 
-def parse_instructions(data):
-    """
-    Parses the given data string and returns a list of instructions found.
-
-    Each instruction is represented as a tuple indicating which instruction was matched:
-    - ("do",)
-    - ("don't",)
-    - ("mul", x, y)  where x and y are integers
+# Precompiled instruction pattern. Only the two mul operands are captured: a match
+# without operands is "do()" or "don't()", which differ in length.
+INSTRUCTION_PATTERN = re.compile(r"do\(\)|don't\(\)|mul\((\d+),(\d+)\)")
 
-    Only correctly formatted instructions are returned; all other text is ignored.
+def process_instructions(data):
     """
-    regex = r"(do\(\))|(don't\(\))|(mul\((\d+),(\d+)\))"
-    instructions = []
-
-    for match in re.findall(regex, data):
-        if match[0]:
-            # Found "do()"
-            instructions.append(("do",))
-        elif match[1]:
-            # Found "don't()"
-            instructions.append(("don't",))
-        else:
-            # Found "mul(X,Y)" with X and Y in match[3] and match[4]
-            x = int(match[3])
-            y = int(match[4])
-            instructions.append(("mul", x, y))
+    Scans the given data string for instructions and returns a list of results.
 
-    return instructions
-
-def process_instructions(instructions):
-    """
-    Processes a list of instructions and returns a list of results.
+    Parsing and accumulation happen in a single pass over the regex matches;
+    all text that is not a correctly formatted instruction is ignored.
 
     - Initially, mul instructions are enabled (valid = 1).
     - "do()" sets valid to 1 (enabled).
@@ -48,14 +26,14 @@ def process_instructions(instructions):
     res = [0, 0]
     valid = 1  # Initially enabled
 
-    for instruction in instructions:
-        if instruction[0] == "do":
-            valid = 1
-        elif instruction[0] == "don't":
-            valid = 0
-        elif instruction[0] == "mul":
-            x, y = instruction[1], instruction[2]
-            product = x * y
+    for match in INSTRUCTION_PATTERN.finditer(data):
+        x = match[1]
+        if x is None:
+            # Found "do()" (4 characters) or "don't()" (7 characters)
+            valid = len(match[0]) == 4
+        else:
+            # Found "mul(X,Y)" with X and Y in groups 1 and 2
+            product = int(x) * int(match[2])
             res[0] += product
             if valid:
                 res[1] += product
@@ -69,11 +47,8 @@ def main():
     with open(input_file, 'r') as f:
         data = f.read()
 
-    # Parse instructions from the data
-    instructions = parse_instructions(data)
-
-    # Process the parsed instructions to get the results
-    results = process_instructions(instructions)
+    # Parse and process the instructions in the data to get the results
+    results = process_instructions(data)
 
     # Print the results: [sum_all, sum_enabled]
     print(results)
@@ -1,90 +1,70 @@
 from pathlib import Path
+import re
 
-def is_valid(grid, row, col):
-    """
-    - Returns True if (row, col) is a valid position in the grid, False otherwise.
-    - Essentially a boundary check to prevent indexing outside the grid.
-    """
-    return 0 <= col < len(grid[0]) and 0 <= row < len(grid)
+# The grid is stored as flat bytes, so cells compare against integer byte values.
+M, A, S = b"MAS"
+
+# Finds every 'A', i.e. every candidate center of an X-MAS shape.
+CENTER_PATTERN = re.compile(b"A")
 
-def check_xmas(grid, start_position, direction):
+def with_row_separators(grid, width, height):
     """
-    - Checks whether starting from 'X' at start_position, we can read 'XMAS' 
-    straight through in the specified direction (horizontal, vertical, or diagonal).
-    - If the subsequent cells align to form 'M', 'A', 'S' in that order, 
-    we consider it a match.
+    - Rejoins the flat grid with a newline after every row, so each row spans
+    width + 1 bytes.
+    - Any walk that steps off the left or right edge of the grid lands on a
+    separator instead of wrapping onto the neighboring row, so no explicit
+    boundary checks are needed.
     """
-    start_x, start_y = start_position
-    step_x, step_y = direction
-
-    return all(
-        is_valid(grid, start_y + step_y * (1 + i), start_x + step_x * (1 + i)) and
-        grid[start_y + step_y * (1 + i)][start_x + step_x * (1 + i)] == c
-        for i, c in enumerate("MAS")
-    )
+    return b"\n".join(grid[row * width:(row + 1) * width] for row in range(height)) + b"\n"
 
-def part1(grid):
+def part1(grid, width, height):
     """
     Part One:
     - We scan the entire grid for every possible occurrence of the word "XMAS".
-    - The word can appear in all eight directions from each 'X' we find.
-    - Each time we confirm 'XMAS' is formed in a line, we increment our count.
+    - The word can appear in all eight directions, so we read the grid as lines
+      in four orientations (rows, columns, and both diagonals) and count "XMAS"
+      forwards and backwards ("SAMX") in each line with bytes.count.
+    - Stepping through the separated buffer with a stride of width, width + 1,
+      or width + 2 walks a down-left diagonal, a column, or a down-right diagonal.
     - Prints the total number found after checking the entire grid.
     """
+    padded = with_row_separators(grid, width, height)
+
     count_occurrences = 0
-    for row in range(len(grid)):
-        for col in range(len(grid[0])):
-            if grid[row][col] == "X":
-                for dx in [-1, 0, 1]:
-                    for dy in [-1, 0, 1]:
-                        if dx == 0 and dy == 0:
-                            continue
-                        if check_xmas(grid, (col, row), (dx, dy)):
-                            count_occurrences += 1
+    for stride in (1, width, width + 1, width + 2):
+        # Pack every line of this orientation into one separated buffer so the
+        # whole orientation is searched with just two bytes.count calls.
+        lines = b"\n".join([padded[offset::stride] for offset in range(stride)])
+        count_occurrences += lines.count(b"XMAS") + lines.count(b"SAMX")
     print(count_occurrences)
 
-def check_xmas_2(grid, center_x, center_y):
-    """
-    Part Two Check:
-    Here 'A' sits at the center of an 'X' shape made by 'M' and 'S'.
-    To qualify as an "X-MAS" shape:
-    - Look at the four diagonals around the 'A'.
-    - They must contain exactly two 'M's and two 'S's arranged in a certain pattern.
-
-    If these conditions are True, it counts as a valid "X-MAS".
-    """
-    for dx in [-1, 1]:
-        for dy in [-1, 1]:
-            if not is_valid(grid, center_y + dy, center_x + dx):
-                return False
-
-    diagonal_chars = [
-        grid[center_y + 1][center_x + 1],
-        grid[center_y - 1][center_x - 1],
-        grid[center_y - 1][center_x + 1],
-        grid[center_y + 1][center_x - 1],
-    ]
-
-    return (diagonal_chars.count("S") == 2 
-            and diagonal_chars.count("M") == 2 
-            and diagonal_chars[0] != diagonal_chars[1])
-
-def part2(grid):
+def part2(grid, width, height):
     """
     Part Two:
     We're looking for "X-MAS" patterns, not just the word "XMAS".
     A valid "X-MAS" is formed by placing 'A' at the center and arranging 
-    'M' and 'S' characters diagonally around it in a specific manner.
-    
-    For each 'A' found in the grid, we check if it meets the "X-MAS" criteria.
+    'M' and 'S' characters diagonally around it in a specific manner:
+    each of the two diagonals through the 'A' must read "MAS" in either direction.
+
+    The positions of every 'A' that is not on the top or bottom row are collected
+    once with a regex scan, and only those centers are checked. Centers on the
+    left or right edge have a separator as a neighbor, so they never match.
     We sum up all occurrences and print the total count.
     """
-    count_x_mas = 0
-    for row in range(len(grid)):
-        for col in range(len(grid[0])):
-            if grid[row][col] == "A":
-                if check_xmas_2(grid, col, row):
-                    count_x_mas += 1
+    padded = with_row_separators(grid, width, height)
+    row_length = width + 1
+
+    centers = [
+        match.start()
+        for match in CENTER_PATTERN.finditer(padded, row_length, len(padded) - row_length)
+    ]
+
+    diagonal_ends = {(M, S), (S, M)}
+    count_x_mas = sum(
+        (padded[i - row_length - 1], padded[i + row_length + 1]) in diagonal_ends
+        and (padded[i - row_length + 1], padded[i + row_length - 1]) in diagonal_ends
+        for i in centers
+    )
     print(count_x_mas)
 
 def main():
@@ -96,15 +76,15 @@ def main():
     "XMAS" might be spelled out in any direction—backwards, diagonally, you name it.
 
     In Part One:
-    - We look through every cell of the grid and try to locate the sequence "XMAS" 
-      in all possible directions. Each successful find is counted.
+    - We read the grid along every row, column, and diagonal and count the sequence
+      "XMAS" in both reading directions. Each successful find is counted.
 
    In Part Two:
     - We're not just looking for the linear word "XMAS" anymore. Instead, we’re searching 
       for a special "X-MAS" formation where 'A' sits at the center of an 'X' made by 'M' and 'S'.
     
     Steps:
-    1. Read the input from 'input.txt' and construct a grid of characters.
+    1. Read the input from 'input.txt' and flatten it into a single bytes grid.
     2. Run part1 to count all straight-line occurrences of "XMAS".
     3. Run part2 to count all "X-MAS" patterns, a more complex arrangement.
     
@@ -112,11 +92,12 @@ def main():
     """
 
     PROJECT_DIR = Path(__file__).parent
-    with open(PROJECT_DIR / "input.txt", 'r') as f:
-        grid = [list(line.strip()) for line in f]
+    lines = (PROJECT_DIR / "input.txt").read_bytes().split()
+    height, width = len(lines), len(lines[0])
+    grid = b"".join(lines)
 
-    part1(grid)
-    part2(grid)
+    part1(grid, width, height)
+    part2(grid, width, height)
 
 if __name__ == "__main__":
     main()
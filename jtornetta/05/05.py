@@ -1,4 +1,9 @@
+from functools import cmp_to_key
 from pathlib import Path
+import re
+
+# Matches one "X|Y" ordering rule and captures both page numbers.
+RULE_PATTERN = re.compile(r"(\d+)\|(\d+)")
 
 def parse_input(input_text: str) -> tuple[list[tuple[int, int]], list[list[int]]]:
     """
@@ -14,80 +19,63 @@ def parse_input(input_text: str) -> tuple[list[tuple[int, int]], list[list[int]]
     - updates: A list of lists, where each sub-list contains page numbers for that update.
     """
     rules_text, updates_text = input_text.strip().split('\n\n')
-    rules = [tuple(map(int, rule.split('|'))) for rule in rules_text.splitlines()]
+    # A single regex pass pulls every rule out of the rules section at once
+    rules = [(int(before), int(after)) for before, after in RULE_PATTERN.findall(rules_text)]
     updates = [list(map(int, update.split(','))) for update in updates_text.splitlines()]
     return rules, updates
 
-def is_valid_order(pages: list[int], rules: list[tuple[int, int]]) -> bool:
+def is_valid_order(pages: list[int], rules_by_before: dict[int, list[int]]) -> bool:
     """
     Checks if a given sequence of pages (one update) obeys all the relevant rules.
     Relevant rules are those for which both pages appear in the given update.
+
+    Rules are looked up by their 'before' page, so only rules that start at a page
+    in this update are examined instead of the full rule list.
     
     Returns True if the update is valid under the given ordering rules, False otherwise.
     """
-    page_set = set(pages)
-    for before, after in rules:
-        if before in page_set and after in page_set:
+    # Map each page to its index once so every rule is checked in O(1)
+    position = {page: index for index, page in enumerate(pages)}
+    for before, before_index in position.items():
+        for after in rules_by_before.get(before, ()):
             # If the 'before' page does not appear before the 'after' page, order is invalid
-            if pages.index(before) >= pages.index(after):
+            if after in position and before_index >= position[after]:
                 return False
     return True
 
-def build_dependency_graph(rules: list[tuple[int, int]], pages: set[int]) -> dict[int, list[int]]:
+def index_rules(rules: list[tuple[int, int]]) -> dict[int, list[int]]:
     """
-    Builds a directed graph representing the dependencies between pages.
-    For each rule 'X|Y' that applies to the current update's pages, create an edge X -> Y,
-    indicating X must come before Y.
+    Groups the rules by their 'before' page, mapping each page to the list of pages
+    that must come after it. Built once so per-update work only touches relevant rules.
     """
-    graph = {}
+    rules_by_before = {}
     for before, after in rules:
-        if before in pages and after in pages:
-            if before not in graph:
-                graph[before] = []
-            graph[before].append(after)
-    return graph
+        rules_by_before.setdefault(before, []).append(after)
+    return rules_by_before
 
-def topological_sort(graph: dict[int, list[int]], pages: set[int]) -> list[int]:
+def fix_order(pages: list[int], rules_set: set[tuple[int, int]]) -> list[int]:
     """
-    Performs a topological sort on the pages according to the dependency graph.
-    This gives a correct ordering of pages that respects all 'must come before' rules.
-    
-    If some pages have no dependencies, they'll appear at the end of the result in arbitrary order.
+    Reorders the pages of an update so that every applicable rule is respected.
+
+    The puzzle's rules give a full ordering between any two pages that share an
+    update, so a plain sort with a comparator built from the rule set is enough:
+    X sorts before Y exactly when there is a rule 'X|Y'.
     """
-    result = []
-    visited = set()
-    temp_visited = set()
-
-    def visit(page: int):
-        if page in temp_visited:
-            return
-        if page in visited:
-            return
-        
-        temp_visited.add(page)
-        for next_page in graph.get(page, []):
-            visit(next_page)
-        temp_visited.remove(page)
-        visited.add(page)
-        result.append(page)
-    
-    # Process all pages, ensuring that those with dependencies are handled first
-    for page in pages:
-        if page not in visited:
-            visit(page)
+    def compare(a: int, b: int) -> int:
+        if (a, b) in rules_set:
+            return -1
+        if (b, a) in rules_set:
+            return 1
+        return 0
 
-    # The result list is built in reverse order, so reverse it to get correct order
-    corrected_order = result[::-1]
-    # Add any pages not in the graph (no dependencies)
-    remaining = pages - set(corrected_order)
-    return corrected_order + list(remaining)
+    return sorted(pages, key=cmp_to_key(compare))
 
 def solve_both_parts(input_path: Path) -> tuple[int, int]:
     """
     Reads the input, determines which updates are already valid, and which need reordering.
     
     - For each valid update, find the "middle" page and accumulate its sum for Part 1.
-    - For each invalid update, reorder the pages using topological sort and then find the "middle" page
+    - For each invalid update, reorder the pages by sorting with the rules and then find the "middle" page
       from this corrected sequence, accumulating its sum for Part 2.
       
     Returns (part1_sum, part2_sum).
@@ -95,24 +83,23 @@ def solve_both_parts(input_path: Path) -> tuple[int, int]:
     # Parse the input into rules and updates
     input_text = input_path.read_text()
     rules, updates = parse_input(input_text)
+    rules_by_before = index_rules(rules)
+    rules_set = set(rules)
     
-    part1_middle_pages = []
-    part2_middle_pages = []
+    part1_sum = 0
+    part2_sum = 0
 
     for update in updates:
-        if is_valid_order(update, rules):
-            # Already in correct order: take the middle page for Part 1
-            middle_idx = len(update) // 2
-            part1_middle_pages.append(update[middle_idx])
+        # Reordering never changes the length, so the middle index is shared by both parts
+        middle_idx = len(update) // 2
+        if is_valid_order(update, rules_by_before):
+            # Already in correct order: add the middle page for Part 1
+            part1_sum += update[middle_idx]
         else:
-            # Not in correct order: fix it by topological sorting, then take the middle page for Part 2
-            pages = set(update)
-            graph = build_dependency_graph(rules, pages)
-            correct_order = topological_sort(graph, pages)
-            middle_idx = len(correct_order) // 2
-            part2_middle_pages.append(correct_order[middle_idx])
+            # Not in correct order: sort it by the rules, then add the middle page for Part 2
+            part2_sum += fix_order(update, rules_set)[middle_idx]
     
-    return sum(part1_middle_pages), sum(part2_middle_pages)
+    return part1_sum, part2_sum
 
 def main():
     """
@@ -131,7 +118,7 @@ def main():
 
     Task for Part Two:
     - For the updates that don't follow the rules, reorder them correctly according to the rules using 
-      a topological sort (a way to line up pages so all constraints are met).
+      a sort whose comparator looks up the rule between each pair of pages.
     - Once corrected, take the middle page from each fixed update and add these up.
     
     You then print both sums:
@@ -1,153 +1,220 @@
 from pathlib import Path
-from typing import Set, Tuple, List, Optional
+from typing import Dict, Tuple, List
 
-def get_next_position(x: int, y: int, direction: str) -> Tuple[int, int]:
-    """
-    Given the current coordinates (x, y) and a direction character (^, v, <, >),
-    determine the next position if the guard moves one step in that direction.
-    
-    Directions:
-    '^' means up    (y-1)
-    'v' means down  (y+1)
-    '<' means left  (x-1)
-    '>' means right (x+1)
+# Directions are numbered clockwise starting from up, in the same order as this string.
+DIRECTIONS = '^>v<'
 
-    Returns:
-    A tuple (new_x, new_y) for the position after a single step in that direction.
-    """
-    moves = {
-        '^': (0, -1),  
-        'v': (0, 1),
-        '<': (-1, 0),
-        '>': (1, 0)
-    }
-    dx, dy = moves[direction]
-    return (x + dx, y + dy)
-
-def turn_right(direction: str) -> str:
+# Step (dx, dy) for each direction index:
+# 0 '^' means up    (y-1)
+# 1 '>' means right (x+1)
+# 2 'v' means down  (y+1)
+# 3 '<' means left  (x-1)
+_MOVES = ((0, -1), (1, 0), (0, 1), (-1, 0))
+
+# Direction index after rotating 90 degrees clockwise: '^' -> '>' -> 'v' -> '<' -> '^'
+_TURN_RIGHT = (1, 2, 3, 0)
+
+# The grid is one flat bytes object, so cells are compared against this byte value
+OBSTACLE = ord('#')
+
+def find_start(grid: bytes, width: int) -> Tuple[int, int, int]:
     """
-    Rotates the guard's facing direction 90 degrees clockwise.
-    
-    Mapping:
-    '^' -> '>'
-    '>' -> 'v'
-    'v' -> '<'
-    '<' -> '^'
+    Searches the flat grid for the guard, marked by one of the direction characters (^, v, <, >).
 
-    Returns the new direction after turning right once.
+    Returns:
+    A tuple (x, y, direction) describing where the guard starts and which way it faces,
+    with the direction as an index into DIRECTIONS.
     """
-    return {'^': '>', '>': 'v', 'v': '<', '<': '^'}[direction]
+    for direction, char in enumerate(DIRECTIONS):
+        index = grid.find(char.encode())
+        if index != -1:
+            return index % width, index // width, direction
+    raise ValueError("No guard found in the grid")
 
-def simulate_guard(grid: List[str], block_pos: Optional[Tuple[int, int]] = None) -> Tuple[Set[Tuple[int, int]], bool]:
+def simulate_guard(grid: bytes, width: int, height: int,
+                   start: Tuple[int, int, int]) -> Tuple[bytearray, Dict[int, Tuple[int, int, int]], bool]:
     """
-    Simulates the guard's movement through the given grid. The guard follows these rules:
+    Simulates the guard's movement through the given flat grid (indexed as
+    grid[y * width + x]), starting from the
+    (x, y, direction) state given by start. The guard follows these rules:
     1. If there is an obstacle directly in front, turn right.
     2. Otherwise, move forward one step.
     
-    Obstacles are represented by '#' in the grid, and block_pos (if provided) acts as an additional obstacle.
+    Obstacles are represented by '#' in the grid.
     
     This simulation also detects loops:
-    - The guard's state (position + direction) is tracked in a set.
-    - If a state repeats, the guard is stuck in a loop.
+    - Every possible state (position + direction) has one byte in a bytearray,
+      at index (y * width + x) * 4 + direction.
+    - If a state's byte is already set, the guard is stuck in a loop.
     
     Returns:
-    - A set of all (x, y) positions the guard visits.
+    - A bytearray with one byte per cell (indexed y * width + x) set to 1 for every
+      position the guard visits.
+    - A dict mapping each visited cell index, other than the start, to the
+      (x, y, direction) state the guard was in right before it first stepped onto
+      that cell.
     - A boolean indicating whether the guard gets stuck in a loop (True) or eventually leaves the map (False).
     """
-    width = len(grid[0])
-    height = len(grid)
-    
-    # Identify guard's starting position and facing direction
-    start_x = start_y = None
-    start_dir = None
-    for y, row in enumerate(grid):
-        for x, char in enumerate(row):
-            if char in '^>v<':
-                start_x, start_y = x, y
-                start_dir = char
-                break
-        if start_dir:
-            break
+    start_x, start_y, start_dir = start
     
-    visited_positions = {(start_x, start_y)}
-    state_history = {(start_x, start_y, start_dir)}
+    visited = bytearray(width * height)
+    first_entry = {}
+    seen_states = bytearray(width * height * 4)
 
     x, y = start_x, start_y
     direction = start_dir
+    visited[y * width + x] = 1
+    seen_states[(y * width + x) * 4 + direction] = 1
 
     while True:
-        next_x, next_y = get_next_position(x, y, direction)
+        dx, dy = _MOVES[direction]
+        next_x, next_y = x + dx, y + dy
         
         # If next step goes off the grid, guard leaves the map
         if not (0 <= next_x < width and 0 <= next_y < height):
-            return visited_positions, False
+            return visited, first_entry, False
         
-        # Check if the next position is blocked either by a '#' or the optional block_pos
-        is_blocked = (grid[next_y][next_x] == '#') or (block_pos and (next_x, next_y) == block_pos)
-        
-        if is_blocked:
-            # Turn right if blocked and check for loop
-            direction = turn_right(direction)
-            new_state = (x, y, direction)
-            if new_state in state_history:
-                return visited_positions, True
-            state_history.add(new_state)
+        if grid[next_y * width + next_x] == OBSTACLE:
+            # Turn right if blocked
+            direction = _TURN_RIGHT[direction]
         else:
-            # Move forward
+            # Move forward, remembering the state we entered a new cell from
+            next_index = next_y * width + next_x
+            if not visited[next_index]:
+                visited[next_index] = 1
+                first_entry[next_index] = (x, y, direction)
             x, y = next_x, next_y
-            visited_positions.add((x, y))
-            new_state = (x, y, direction)
-            if new_state in state_history:  # Loop detection
-                return visited_positions, True
-            state_history.add(new_state)
 
-def find_loop_positions(grid: List[str]) -> int:
+        # Loop detection
+        state = (y * width + x) * 4 + direction
+        if seen_states[state]:
+            return visited, first_entry, True
+        seen_states[state] = 1
+
+def build_jump_table(grid: bytes, width: int, height: int) -> List[List[int]]:
+    """
+    Precomputes, for every cell and every direction, the coordinate of the next
+    '#' the guard would run into when walking straight from that cell.
+
+    The table is indexed as jumps[direction][y * width + x], with directions
+    numbered as in DIRECTIONS ('^' = 0, '>' = 1, 'v' = 2, '<' = 3). Vertical
+    directions store a row and horizontal directions store a column. When there is
+    no obstacle ahead the entry is just past the edge of the map (-1, height, or width).
+    """
+    up, right, down, left = ([0] * (width * height) for _ in range(4))
+
+    for y in range(height):
+        # Sweep each row left-to-right for '<' and right-to-left for '>'
+        obstacle = -1
+        for x in range(width):
+            left[y * width + x] = obstacle
+            if grid[y * width + x] == OBSTACLE:
+                obstacle = x
+        obstacle = width
+        for x in range(width - 1, -1, -1):
+            right[y * width + x] = obstacle
+            if grid[y * width + x] == OBSTACLE:
+                obstacle = x
+
+    for x in range(width):
+        # Sweep each column top-to-bottom for '^' and bottom-to-top for 'v'
+        obstacle = -1
+        for y in range(height):
+            up[y * width + x] = obstacle
+            if grid[y * width + x] == OBSTACLE:
+                obstacle = y
+        obstacle = height
+        for y in range(height - 1, -1, -1):
+            down[y * width + x] = obstacle
+            if grid[y * width + x] == OBSTACLE:
+                obstacle = y
+
+    return [up, right, down, left]
+
+def simulate_guard_jump(jumps: List[List[int]], width: int, height: int,
+                        start: Tuple[int, int, int], block_pos: Tuple[int, int]) -> bool:
+    """
+    Checks whether the guard gets stuck in a loop when block_pos is an extra obstacle.
+
+    Instead of stepping one cell at a time, each straight segment is a single lookup
+    in the jump table. If block_pos lies on the segment before the table's obstacle,
+    the guard stops in front of block_pos instead. After every turn the state
+    (position + direction) is recorded in a bytearray; a repeated turn state means
+    the guard is in a loop.
+
+    The walk begins at the given (x, y, direction) start state, which may be any
+    state on the baseline path, not only the guard's initial position.
+
+    Returns True if the guard loops, False if it walks off the map.
+    """
+    up, right, down, left = jumps
+    block_x, block_y = block_pos
+    x, y, direction = start
+    seen_states = bytearray(width * height * 4)
+
+    while True:
+        i = y * width + x
+        if direction == 0:
+            obstacle = up[i]
+            if block_x == x and obstacle < block_y < y:
+                obstacle = block_y
+            if obstacle < 0:
+                return False
+            y = obstacle + 1
+        elif direction == 1:
+            obstacle = right[i]
+            if block_y == y and x < block_x < obstacle:
+                obstacle = block_x
+            if obstacle >= width:
+                return False
+            x = obstacle - 1
+        elif direction == 2:
+            obstacle = down[i]
+            if block_x == x and y < block_y < obstacle:
+                obstacle = block_y
+            if obstacle >= height:
+                return False
+            y = obstacle - 1
+        else:
+            obstacle = left[i]
+            if block_y == y and obstacle < block_x < x:
+                obstacle = block_x
+            if obstacle < 0:
+                return False
+            x = obstacle + 1
+
+        # Turn right at the obstacle and check for a loop
+        direction = _TURN_RIGHT[direction]
+        state = (y * width + x) * 4 + direction
+        if seen_states[state]:
+            return True
+        seen_states[state] = 1
+
+def find_loop_positions(width: int, height: int, first_entry: Dict[int, Tuple[int, int, int]],
+                        jumps: List[List[int]]) -> int:
     """
     Determines how many positions in the grid, if turned into an obstacle, would cause the guard to loop.
     
     Strategy:
-    - First, simulate the guard's original path to know which positions are visited.
-    - Consider placing a new obstacle in positions adjacent to the guard's path (and not the starting spot).
-    - For each candidate position, simulate again and check if it creates a loop.
+    - Consider placing a new obstacle on each position of the guard's original path
+      (except the starting spot), as given by first_entry from the baseline walk.
+    - Up to the moment the guard first reaches a candidate, its walk is identical to
+      the baseline, so each probe resumes from the state right before that cell
+      instead of replaying the path from the start.
+    - For each candidate position, simulate the rest of the walk with the jump table
+      and check if it creates a loop.
     
     Returns:
     The count of such positions where a new obstacle creates a patrol loop.
     """
-    width = len(grid[0])
-    height = len(grid)
-    
-    # Guard's original patrol path
-    original_visited, _ = simulate_guard(grid)
-
-    # Find guard's start position
-    start_pos = None
-    for y, row in enumerate(grid):
-        for x, char in enumerate(row):
-            if char in '^>v<':
-                start_pos = (x, y)
-                break
-        if start_pos:
-            break
-
+    # An obstacle only changes the route if the guard would walk into it, so the
+    # candidates are exactly the visited cells other than the start position.
+    # Visited cells are never existing obstacles.
     loop_count = 0
-    positions_to_check = set()
-
-    # Consider positions around the guard's visited path
-    # Only add positions that are within the grid, not obstacles, and not the start position.
-    for x, y in original_visited:
-        for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
-            test_x, test_y = x + dx, y + dy
-            if (0 <= test_x < width and 0 <= test_y < height and
-                grid[test_y][test_x] != '#' and
-                (test_x, test_y) != start_pos):
-                positions_to_check.add((test_x, test_y))
-
-    # Test only those positions the guard actually could reach
-    for test_pos in positions_to_check:
-        if test_pos in original_visited:
-            _, creates_loop = simulate_guard(grid, test_pos)
-            if creates_loop:
-                loop_count += 1
+    for index, entry_state in first_entry.items():
+        test_pos = (index % width, index // width)
+        if simulate_guard_jump(jumps, width, height, entry_state, test_pos):
+            loop_count += 1
 
     return loop_count
 
@@ -157,10 +224,17 @@ def solve_puzzle(input_path: Path) -> Tuple[int, int]:
     Part 1: Count how many distinct positions the guard visits before leaving the map.
     Part 2: Find how many positions would cause a loop if turned into a new obstacle.
     """
-    grid = input_path.read_text().strip().splitlines()
-    visited_positions, _ = simulate_guard(grid)
-    part1 = len(visited_positions)
-    part2 = find_loop_positions(grid)
+    # Flatten the map into one bytes object so each cell lookup is a single index
+    rows = input_path.read_bytes().split()
+    width, height = len(rows[0]), len(rows)
+    grid = b''.join(rows)
+    start = find_start(grid, width)
+    # The baseline walk gives both Part 1 and the resume states for Part 2
+    visited, first_entry, _ = simulate_guard(grid, width, height, start)
+    part1 = visited.count(1)
+    # Next-obstacle lookups let each Part 2 probe jump over whole straight segments
+    jumps = build_jump_table(grid, width, height)
+    part2 = find_loop_positions(width, height, first_entry, jumps)
     return part1, part2
 
 def main() -> None:
@@ -180,7 +254,7 @@ def main() -> None:
     Part Two:
     The Historians want to safely search the lab without interference. 
     They consider placing a new obstacle somewhere that causes the guard to get stuck in a loop. 
-    By testing potential obstacle placements adjacent to the guard's original path and re-simulating the route, 
+    By testing potential obstacle placements on the guard's original path and re-simulating the route, 
     you can find out which positions would create such a loop. 
     Count how many such positions exist.
 
@@ -1,6 +1,5 @@
 from pathlib import Path
-from itertools import product
-from typing import List, Tuple, Dict
+from typing import List, Tuple
 from functools import lru_cache
 
 def parse_input(file_path: Path) -> List[Tuple[int, List[int]]]:
@@ -13,71 +12,37 @@ def parse_input(file_path: Path) -> List[Tuple[int, List[int]]]:
     I use tuples instead of lists for the numbers because tuples are immutable,
     which lets me use them as dictionary keys and in caching."""
     equations = []
-    with file_path.open() as f:
-        for line in f:
-            if line.strip():
-                test_str, nums_str = line.split(': ')
-                test_value = int(test_str)
-                numbers = tuple(int(x) for x in nums_str.split())
-                equations.append((test_value, numbers))
+    # Read the whole file once and work on raw bytes; int() accepts bytes directly
+    for line in file_path.read_bytes().splitlines():
+        if line:
+            colon = line.index(b':')
+            test_value = int(line[:colon])
+            numbers = tuple(map(int, line[colon + 2:].split()))
+            equations.append((test_value, numbers))
     return equations
 
-@lru_cache(maxsize=10000)
 def quick_concat(a: int, b: int) -> int:
     """Concatenate two numbers together using math operations.
     
-    The @lru_cache decorator tells Python to remember the results of this function.
-    If its called again with the same inputs, it returns the cached result instead
-    of recalculating. This is to help improve the speed due to the repeated concatenations.
-    
     How it works for quick_concat(12, 345):
-    1. 345 has 3 digits
-    2. 12 * 10^3 = 12000
+    1. Find the smallest power of ten above 345 by multiplying up: 10, 100, 1000
+    2. 12 * 1000 = 12000
     3. 12000 + 345 = 12345
     
-    This should be faster than converting both numbers to strings, concatenating,
-    and converting back to an integer."""
-    b_str = str(b)  # Convert second number to string to count digits
-    return a * (10 ** len(b_str)) + b
-
-def evaluate(numbers: List[int], operators: List[str], target: int) -> bool:
-    """Try to reach the target value by applying operators to numbers left-to-right.
-    
-    For example, with numbers [2, 3, 4] and operators ['+', '*']:
-    1. Start with 2
-    2. Apply '+' to get 2 + 3 = 5
-    3. Apply '*' to get 5 * 4 = 20
-    
-    We return False early if our result gets too big (over 10^15) since our
-    target values are never that large. This saves time by avoiding unnecessary
-    calculations with huge numbers.
-    
-    Available operators:
-    '+' : Addition
-    '*' : Multiplication
-    '||': Concatenation (for part 2)"""
-    result = numbers[0]
-    
-    for i, op in enumerate(operators):
-        # Exit early if number is getting huge
-        if result > 10**15:
-            return False
-            
-        num = numbers[i + 1]
-        if op == '+':
-            result += num
-        elif op == '*':
-            result *= num
-        else:  # '||' (concatenation)
-            result = quick_concat(result, num)
-            
-    return result == target
+    Counting digits with a few integer compares avoids converting b to a string
+    on every call, and is cheaper than a cache lookup would be."""
+    power = 10
+    while b >= power:
+        power *= 10
+    return a * power + b
 
+@lru_cache(maxsize=None)
 def check_equation(test_value: int, numbers: Tuple[int], use_concat: bool = False) -> bool:
     """Check if we can make the test value using our numbers and available operators.
     
-    We try every possible combination of operators between the numbers. For example,
-    with numbers [2, 3, 4] we might try:
+    Operators are applied left-to-right, so the choices form a tree: at each number
+    we branch on +, * and (in part 2) ||. For example, with numbers [2, 3, 4] the
+    leaves include:
     - 2 + 3 + 4
     - 2 + 3 * 4
     - 2 * 3 + 4
@@ -86,24 +51,37 @@ def check_equation(test_value: int, numbers: Tuple[int], use_concat: bool = Fals
     - 2 || 3 + 4
     - 2 + 3 || 4
     etc.
+
+    We walk this tree depth-first with an explicit stack of (index, running result)
+    pairs. Every operator only makes the running result bigger (all numbers are
+    positive), so a branch is dropped as soon as it passes the test value, which
+    skips most of the combinations.
+
+    Results are cached by (test_value, numbers, use_concat), which is why numbers
+    must be a tuple, so any equation repeated in the input is only solved once.
     
     Parameters:
         test_value: The number we're trying to make
         numbers: Tuple of numbers we can use
         use_concat: Whether to allow the || operator (True for part 2)"""
-    if len(numbers) == 1:
-        return numbers[0] == test_value
-    
-    # Build list of allowed operators
-    ops = ['+', '*']
-    if use_concat:
-        ops.append('||')
-    
-    # Try every possible combination of operators
-    num_slots = len(numbers) - 1  # We need one less operator than numbers
-    for ops_combo in product(ops, repeat=num_slots):
-        if evaluate(list(numbers), ops_combo, test_value):
-            return True
+    count = len(numbers)
+    stack = [(1, numbers[0])]
+    
+    while stack:
+        index, result = stack.pop()
+        # Prune branches that have already overshot the target
+        if result > test_value:
+            continue
+        if index == count:
+            if result == test_value:
+                return True
+            continue
+        
+        num = numbers[index]
+        stack.append((index + 1, result + num))
+        stack.append((index + 1, result * num))
+        if use_concat:
+            stack.append((index + 1, quick_concat(result, num)))
     
     return False
 
@@ -113,28 +91,20 @@ def solve_parts(input_path: Path) -> Tuple[int, int]:
     Part 1: Using only + and * operators
     Part 2: Using +, *, and || operators
     
-    1. Group equations by length (number of operands)
-    2. Process all equations of the same length together
-    3. If an equation works in part 1, reuse it for part 2)"""
+    All equations are handled in a single pass over the parsed input;
+    if an equation works in part 1, it is reused for part 2 without another search."""
     equations = parse_input(input_path)
     part1_sum = 0
     part2_sum = 0
     
-    # Group equations by length for better cache usage
-    by_length: Dict[int, List[Tuple[int, Tuple[int, ...]]]] = {}
     for test_value, numbers in equations:
-        by_length.setdefault(len(numbers), []).append((test_value, numbers))
-    
-    # Process equations grouped by length
-    for length in sorted(by_length.keys()):
-        for test_value, numbers in by_length[length]:
-            # Try part 1 first (no concatenation)
-            if check_equation(test_value, numbers, False):
-                part1_sum += test_value
-                part2_sum += test_value
-            # Only check part 2 if part 1 failed
-            elif check_equation(test_value, numbers, True):
-                part2_sum += test_value
+        # Try part 1 first (no concatenation)
+        if check_equation(test_value, numbers, False):
+            part1_sum += test_value
+            part2_sum += test_value
+        # Only check part 2 if part 1 failed
+        elif check_equation(test_value, numbers, True):
+            part2_sum += test_value
     
     return part1_sum, part2_sum
 
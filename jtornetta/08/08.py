@@ -1,7 +1,12 @@
 import itertools
+import re
+from functools import lru_cache
 from math import gcd
 from pathlib import Path
 
+# An antenna is any ASCII letter or digit; everything else ('.', '#') is empty ground.
+ANTENNA_PATTERN = re.compile(r"[0-9A-Za-z]")
+
 def collect_antennas_by_frequency(input_lines):
     """
     According to the puzzle narrative, each position in the grid may contain an antenna 
@@ -11,6 +16,8 @@ def collect_antennas_by_frequency(input_lines):
     This function scans the grid (list of input lines) and groups the coordinates 
     of antennas by their frequency. For example, if 'a' appears at multiple grid positions, 
     all those positions are collected under frequency 'a'.
+    Each line is scanned with a precompiled regex, so only the antenna cells are
+    visited in Python rather than every cell.
     
     Returns:
     - antennas_by_freq: A dictionary mapping each frequency character to a list of (row, col) positions.
@@ -22,47 +29,50 @@ def collect_antennas_by_frequency(input_lines):
     total_cols = max(len(line) for line in input_lines) if input_lines else 0
     
     for row_index, line in enumerate(input_lines):
-        for col_index, char in enumerate(line):
-            if char.isalnum():
-                # Add this antenna's position under its frequency character
-                antennas_by_freq.setdefault(char, []).append((row_index, col_index))
+        for match in ANTENNA_PATTERN.finditer(line):
+            # Add this antenna's position under its frequency character
+            antennas_by_freq.setdefault(match.group(), []).append((row_index, match.start()))
                 
     return antennas_by_freq, total_rows, total_cols
 
 
-def get_line_positions(row_start, col_start, row_end, col_end, total_rows, total_cols):
+@lru_cache(maxsize=None)
+def reduced_step(delta_row, delta_col):
+    """
+    Reduces the offset between two antennas to the smallest integer step along the same
+    line by dividing out the greatest common divisor, keeping the signs.
+    
+    The same offsets come up again and again between pairs of antennas, so the result is cached.
+    """
+    step_divisor = gcd(delta_row, delta_col) or 1
+    return delta_row // step_divisor, delta_col // step_divisor
+
+
+def mark_line_positions(antinode_grid, row_start, col_start, row_end, col_end, total_rows, total_cols):
     """
     In the updated model (Part 2 of the puzzle), any position that lies on a straight line 
     defined by two antennas of the same frequency is considered an antinode position.
     
     This function finds every grid cell that lies on the infinite straight line passing 
     through two given points. The line is extended across the entire grid in both directions, 
-    and all positions along that line are collected.
-    
-    Returns:
-    A set of (row, col) positions on that line within the grid boundaries.
+    and every position along that line is marked in antinode_grid, a bytearray with one
+    byte per cell indexed as row * total_cols + col. Marking bytes instead of adding
+    (row, col) tuples to a set avoids hashing every point.
     """
-    line_positions = set()
-    delta_row = row_end - row_start
-    delta_col = col_end - col_start
-    
-    # Determine the step increments by using the greatest common divisor
-    step_divisor = gcd(delta_row, delta_col) or 1
-    step_row = delta_row // step_divisor
-    step_col = delta_col // step_divisor
+    step_row, step_col = reduced_step(row_end - row_start, col_end - col_start)
     
-    # Trace the line in both directions starting from one antenna
-    for direction in (1, -1):
-        current_row, current_col = row_start, col_start
+    # Trace the line forwards from one antenna, then backwards from the cell before it
+    for row_step, col_step, current_row, current_col in (
+        (step_row, step_col, row_start, col_start),
+        (-step_row, -step_col, row_start - step_row, col_start - step_col),
+    ):
         while 0 <= current_row < total_rows and 0 <= current_col < total_cols:
-            line_positions.add((current_row, current_col))
-            current_row += step_row * direction
-            current_col += step_col * direction
-            
-    return line_positions
+            antinode_grid[current_row * total_cols + current_col] = 1
+            current_row += row_step
+            current_col += col_step
 
 
-def compute_antinode_positions(antennas_by_freq, total_rows, total_cols, mode='part1'):
+def count_antinodes(antennas_by_freq, total_rows, total_cols):
     """
     The puzzle describes two different criteria for identifying antinodes:
 
@@ -77,36 +87,29 @@ def compute_antinode_positions(antennas_by_freq, total_rows, total_cols, mode='p
     it's no longer just about being twice the distance; any position collinear with at least two same-frequency 
     antennas counts.
 
-    Parameters:
-    - mode='part1': Use the original rule (antinode where one antenna is double the distance of the other).
-    - mode='part2': Use the updated rule (antinode at all collinear positions).
+    Both rules only depend on pairs of same-frequency antennas, so they are evaluated
+    together in a single pass over the pairs, each marking its own grid.
 
     Returns:
-    A set of all unique antinode positions in the grid.
+    A tuple (part1_count, part2_count) of unique antinode positions in the grid.
     """
-    antinodes = set()
+    # One byte per grid cell for each part, set to 1 once the cell is known to be an antinode
+    part1_grid = bytearray(total_rows * total_cols)
+    part2_grid = bytearray(total_rows * total_cols)
     
     for freq, antenna_positions in antennas_by_freq.items():
         # Consider all pairs of antennas with the same frequency
-        for antenna_a, antenna_b in itertools.combinations(antenna_positions, 2):
-            row_a, col_a = antenna_a
-            row_b, col_b = antenna_b
+        for (row_a, col_a), (row_b, col_b) in itertools.combinations(antenna_positions, 2):
+            # Part 1: the two potential antinodes from the pair A-B, 2B - A and 2A - B
+            for row, col in ((2 * row_b - row_a, 2 * col_b - col_a),
+                             (2 * row_a - row_b, 2 * col_a - col_b)):
+                if 0 <= row < total_rows and 0 <= col < total_cols:
+                    part1_grid[row * total_cols + col] = 1
             
-            if mode == 'part1':
-                # Compute the two potential antinodes from the pair A-B
-                reflected_from_a = (2 * row_b - row_a, 2 * col_b - col_a)  # 2B - A
-                reflected_from_b = (2 * row_a - row_b, 2 * col_a - col_b)  # 2A - B
-                
-                for candidate in [reflected_from_a, reflected_from_b]:
-                    if 0 <= candidate[0] < total_rows and 0 <= candidate[1] < total_cols:
-                        antinodes.add(candidate)
-            
-            elif mode == 'part2':
-                # For the updated rule, include all positions on the line passing through A and B
-                line_positions = get_line_positions(row_a, col_a, row_b, col_b, total_rows, total_cols)
-                antinodes.update(line_positions)
+            # Part 2: all positions on the line passing through A and B
+            mark_line_positions(part2_grid, row_a, col_a, row_b, col_b, total_rows, total_cols)
     
-    return antinodes
+    return part1_grid.count(1), part2_grid.count(1)
 
 
 def main():
@@ -128,8 +131,8 @@ def main():
     This program:
     - Reads the antenna map.
     - Identifies antennas by their frequencies and collects their coordinates.
-    - Computes antinodes first under the original rule (Part 1).
-    - Computes antinodes again under the updated rule (Part 2).
+    - Computes antinodes under the original rule (Part 1) and the updated
+      rule (Part 2) in the same pass over antenna pairs.
     
     It then prints the number of unique antinodes found for both parts. 
     """
@@ -142,13 +145,10 @@ def main():
     # Gather antenna positions by frequency
     antennas_by_freq, rows, cols = collect_antennas_by_frequency(input_lines)
     
-    # Part 1: Original antinode calculation
-    antinodes_part1 = compute_antinode_positions(antennas_by_freq, rows, cols, 'part1')
-    print(f"Part1 - Unique antinode positions: {len(antinodes_part1)}")
-    
-    # Part 2: Updated antinode calculation with resonant harmonics
-    antinodes_part2 = compute_antinode_positions(antennas_by_freq, rows, cols, 'part2')
-    print(f"Part2 - Unique antinode positions: {len(antinodes_part2)}")
+    # Part 1 (original rule) and Part 2 (resonant harmonics) share one pass over antenna pairs
+    antinodes_part1, antinodes_part2 = count_antinodes(antennas_by_freq, rows, cols)
+    print(f"Part1 - Unique antinode positions: {antinodes_part1}")
+    print(f"Part2 - Unique antinode positions: {antinodes_part2}")
     
 
 if __name__ == "__main__":
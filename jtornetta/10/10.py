@@ -1,90 +1,61 @@
 from pathlib import Path
-from collections import deque
-from dataclasses import dataclass
-from typing import List, Set, Tuple, Dict
+from typing import List, Tuple
 
-@dataclass
-class Point:
-    """
-    Represents a position on the topographic map.
-    
-    Attributes:
-        row (int): The vertical position in the grid.
-        col (int): The horizontal position in the grid.
-    """
-    row: int
-    col: int
-    
-    def __hash__(self):
-        return hash((self.row, self.col))
-        
-    def neighbors(self, height: int, width: int) -> List['Point']:
-        """
-        Returns valid neighboring points within grid bounds.
-        
-        Args:
-            height (int): The total number of rows in the grid.
-            width (int): The total number of columns in the grid.
-            
-        Returns:
-            List[Point]: List of valid adjacent points (up, down, left, right).
-            
-        Notes:
-            Hiking trails only allow orthogonal movement (no diagonals).
-        """
-        deltas = [(0, 1), (1, 0), (0, -1), (-1, 0)]  # right, down, left, up
-        points = []
-        for dr, dc in deltas:
-            new_row, new_col = self.row + dr, self.col + dc
-            if 0 <= new_row < height and 0 <= new_col < width:
-                points.append(Point(new_row, new_col))
-        return points
+# Height stored in the border around the map. No trail step can lead onto it,
+# since it is never one more than a real height.
+EDGE = 255
 
-def load_grid() -> List[List[int]]:
+def load_grid() -> Tuple[bytes, int]:
     """
     Loads and parses the topographic map
     
     Returns:
-        List[List[int]]: 2D grid where each cell contains a height value (0-9).
+        Tuple[bytes, int]: The grid flattened row by row into a bytes object
+        where each byte is a height value (0-9), followed by the row width. The map
+        is surrounded by a one-cell border of EDGE bytes, and the width includes it.
         
     Notes:
         Each character in the input represents a height from 0 (lowest) to 9 (highest).
+        Thanks to the border, the neighbors of any map cell are always at the offsets
+        +1, -1, +width and -width, without bounds checks.
     """
     input_file = Path(__file__).parent / 'input.txt'
-    with open(input_file) as f:
-        return [[int(char) for char in line.strip()] for line in f]
+    rows = input_file.read_bytes().split()
+    width = len(rows[0]) + 2
+    edge = bytes([EDGE])
+    # Shift the ASCII digits down so each byte holds the height itself
+    padded_rows = [edge + bytes(char - ord('0') for char in row) + edge for row in rows]
+    return edge * width + b''.join(padded_rows) + edge * width, width
 
-def find_trailheads(grid: List[List[int]]) -> List[Point]:
+def group_by_height(grid: bytes) -> List[List[int]]:
     """
-    Identifies all potential trailhead positions on the map.
+    Buckets every cell of the map by its height.
     
     Args:
-        grid (List[List[int]]): The 2D topographic map grid.
+        grid (bytes): The flattened topographic map grid.
         
     Returns:
-        List[Point]: List of all positions with height 0 (potential trailheads).
-        
-    Notes:
-        A trailhead is any position with height 0 that can start hiking trails.
+        List[List[int]]: Ten lists where entry h holds the flat indexes of all cells of height h.
     """
-    height, width = len(grid), len(grid[0])
-    return [
-        Point(row, col)
-        for row in range(height)
-        for col in range(width)
-        if grid[row][col] == 0
-    ]
+    cells = [[] for _ in range(10)]
+    for index, cell in enumerate(grid):
+        if cell != EDGE:
+            cells[cell].append(index)
+    return cells
 
-def count_reachable_peaks(grid: List[List[int]], start: Point) -> int:
+def score_trailheads(grid: bytes, width: int, cells_by_height: List[List[int]]) -> Tuple[int, int]:
     """
-    Counts height-9 positions reachable via valid hiking trails from a trailhead.
+    Computes the total score and total rating of all trailheads in one sweep.
     
     Args:
-        grid (List[List[int]]): The 2D topographic map grid.
-        start (Point): Starting trailhead position.
+        grid (bytes): The flattened topographic map grid, with its EDGE border.
+        width (int): The width of a grid row, including the border.
+        cells_by_height (List[List[int]]): Flat indexes of the cells of each height.
         
     Returns:
-        int: Number of unique height-9 positions reachable from this trailhead.
+        Tuple[int, int]: The sum over all trailheads of the number of unique height-9
+        positions reachable from them (scores), and of the number of distinct paths
+        from them to any height-9 position (ratings).
         
     Notes:
         A valid hiking trail must:
@@ -92,86 +63,38 @@ def count_reachable_peaks(grid: List[List[int]], start: Point) -> int:
         - Increase by exactly 1 at each step
         - Only move orthogonally (up, down, left, right)
         - Reach a position of height 9
-    """
-    height, width = len(grid), len(grid[0])
-    visited = set()
-    peaks = set()
-    
-    def dfs(point: Point, current_height: int) -> None:
-        """
-        Recursive DFS helper that explores valid hiking trails.
-        
-        Args:
-            point (Point): Current position being explored.
-            current_height (int): Expected height at this position.
-            
-        Notes:
-            Updates the global visited and peaks sets.
-            Backtracks if current position doesn't match expected height.
-        """
-        if point in visited:
-            return
-            
-        visited.add(point)
-        grid_height = grid[point.row][point.col]
-        
-        if grid_height != current_height:
-            return
-            
-        if grid_height == 9:
-            peaks.add(point)
-            
-        for neighbor in point.neighbors(height, width):
-            if grid[neighbor.row][neighbor.col] == current_height + 1:
-                dfs(neighbor, current_height + 1)
-    
-    dfs(start, 0)
-    return len(peaks)
-
-def count_distinct_paths(grid: List[List[int]], start: Point) -> int:
-    """
-    Counts distinct possible hiking trails from a trailhead to any height-9 position.
-    
-    Args:
-        grid (List[List[int]]): The 2D topographic map grid.
-        start (Point): Starting trailhead position.
-        
-    Returns:
-        int: Total number of unique valid paths from this trailhead to any height-9 position.
         
-    Notes:
-        A distinct path:
-        - Must follow valid hiking trail rules (increment by 1, orthogonal moves only)
-        - Is counted separately even if it reaches the same peak as another path
-        - Is defined by its unique sequence of moves
+        A distinct path is counted separately even if it reaches the same peak as
+        another path.
         
-        Uses BFS with path counting to track all possible routes efficiently.
+        Each height-9 cell is given its own bit, and the set of peaks reachable from a
+        cell is kept as an int bitmask. Sweeping the heights from 9 down to 0, a cell's
+        bitmask is the OR of the bitmasks of its neighbors one step higher, and its
+        path count is the sum of theirs, so every cell is visited once for both parts
+        and all trailheads together.
     """
-    height, width = len(grid), len(grid[0])
-    paths_to = {start: 1}  # Maps points to number of distinct paths reaching them
-    queue = deque([(start, 0)])  # Tracks points to explore and their current height
+    reachable = [0] * len(grid)  # Bitmask of the peaks reachable from each cell
+    paths_from = [0] * len(grid)  # Number of distinct paths from each cell to any peak
+    offsets = (1, width, -1, -width)  # Orthogonal moves only
+    for bit, peak in enumerate(cells_by_height[9]):
+        reachable[peak] = 1 << bit
+        paths_from[peak] = 1
     
-    while queue:
-        point, current_height = queue.popleft()
-        paths_here = paths_to[point]
-        
-        for neighbor in point.neighbors(height, width):
-            neighbor_height = grid[neighbor.row][neighbor.col]
-            
-            if neighbor_height != current_height + 1:
-                continue
-                
-            if neighbor not in paths_to:
-                queue.append((neighbor, neighbor_height))
-                paths_to[neighbor] = 0
-            paths_to[neighbor] += paths_here
+    for current_height in range(8, -1, -1):
+        for point in cells_by_height[current_height]:
+            peaks = paths = 0
+            for offset in offsets:
+                neighbor = point + offset
+                if grid[neighbor] == current_height + 1:
+                    peaks |= reachable[neighbor]
+                    paths += paths_from[neighbor]
+            reachable[point] = peaks
+            paths_from[point] = paths
     
-    return sum(
-        paths_to[Point(row, col)]
-        for row in range(height)
-        for col in range(width)
-        if grid[row][col] == 9 and Point(row, col) in paths_to
-    )
+    trailheads = cells_by_height[0]
+    total_score = sum(reachable[start].bit_count() for start in trailheads)
+    total_rating = sum(paths_from[start] for start in trailheads)
+    return total_score, total_rating
 
 def main():
     """
@@ -194,21 +117,19 @@ def main():
     
     Process:
         1. Loads the topographic map from input.txt
-        2. Identifies all trailhead positions (height 0)
-        3. For each trailhead:
+        2. Groups cells by height; the height-0 cells are the trailheads
+        3. In one sweep down the heights, for all trailheads together:
             - Part 1: Counts reachable height-9 positions (score)
             - Part 2: Counts distinct possible paths to any height-9 position (rating)
         4. Outputs the sum of all trailhead scores and ratings
     """
-    grid = load_grid()
-    trailheads = find_trailheads(grid)
+    grid, width = load_grid()
+    cells_by_height = group_by_height(grid)
     
     # Part 1: Sum of scores (reachable peaks per trailhead)
-    total_score = sum(count_reachable_peaks(grid, start) for start in trailheads)
-    print(f"Part 1: {total_score}")
-    
     # Part 2: Sum of ratings (distinct paths per trailhead)
-    total_rating = sum(count_distinct_paths(grid, start) for start in trailheads)
+    total_score, total_rating = score_trailheads(grid, width, cells_by_height)
+    print(f"Part 1: {total_score}")
     print(f"Part 2: {total_rating}")
 
 if __name__ == '__main__':
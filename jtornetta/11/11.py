@@ -1,6 +1,9 @@
 from pathlib import Path
-from typing import Dict, List, Tuple
-from collections import defaultdict
+from typing import Dict, List
+from collections import Counter, defaultdict
+
+# Powers of ten, indexed by exponent; large enough for any stone reached in 75 blinks
+POW10 = [10 ** i for i in range(20)]
 
 def load_stones(filename: str) -> List[int]:
     """
@@ -14,45 +17,47 @@ def load_stones(filename: str) -> List[int]:
     """
     return list(map(int, open(filename).readline().strip().split()))
 
-def solve(stone: int, blinks: int, memory: Dict[Tuple[int, int], int], 
-        depth: int = 0) -> int:
+def count_digits(stone: int) -> int:
     """
-    Recursively calculate resulting stones using memoization.
+    Count the decimal digits of a stone value without converting it to a string.
     
     Args:
-        stone (int): Current stone value
-        blinks (int): Number of blinks remaining
-        memory: Cache of previously calculated results
+        stone (int): Stone value (positive)
         
     Returns:
-        int: Number of stones that will result from this stone
-        
-    Note:
-        Uses memoization with (stone, blinks) as cache key.
-        Each subproblem is only calculated once, then cached.
+        int: Number of decimal digits
     """
-    # Base case: no more transformations
-    if blinks == 0:
-        return 1
-        
-    # Check memoization cache
-    if (stone, blinks) in memory:
-        return memory[(stone, blinks)]
+    # stone >= 2 ** (bit_length - 1) and log10(2) ~ 0.30103, so this estimate is exact or one too low
+    digits = ((stone.bit_length() - 1) * 30103) // 100000 + 1
+    if digits < len(POW10) and stone >= POW10[digits]:
+        digits += 1
+    return digits
+
+def blink(counts: Dict[int, int]) -> Dict[int, int]:
+    """
+    Apply one blink to every distinct stone value at once.
     
-    # Apply transformation rules
-    if stone == 0:
-        val = solve(1, blinks - 1, memory, depth + 1)
-    elif len(str_stone := str(stone)) % 2 == 0:
-        mid = len(str_stone) // 2
-        left = solve(int(str_stone[:mid]), blinks - 1, memory, depth + 1)
-        right = solve(int(str_stone[mid:]), blinks - 1, memory, depth + 1)
-        val = left + right
-    else:
-        val = solve(stone * 2024, blinks - 1, memory, depth + 1)
+    Args:
+        counts (Dict[int, int]): Number of stones carrying each value
+        
+    Returns:
+        Dict[int, int]: Number of stones carrying each value after the blink
         
-    # Cache and return
-    memory[(stone, blinks)] = val
-    return val
+    Note:
+        Stones with the same value always transform the same way, so each
+        distinct value is transformed once and its count carried over.
+    """
+    next_counts = defaultdict(int)
+    for stone, count in counts.items():
+        if stone == 0:
+            next_counts[1] += count
+        elif (digits := count_digits(stone)) % 2 == 0:
+            left, right = divmod(stone, POW10[digits // 2])
+            next_counts[left] += count
+            next_counts[right] += count
+        else:
+            next_counts[stone * 2024] += count
+    return next_counts
 
 def simulate_stones(stones: List[int], blinks: int) -> int:
     """
@@ -65,11 +70,11 @@ def simulate_stones(stones: List[int], blinks: int) -> int:
     Returns:
         int: Total number of stones after all transformations
     """
-    memory = {}
-    
-    result = sum(solve(stone, blinks, memory) for stone in stones)
+    counts = Counter(stones)
+    for _ in range(blinks):
+        counts = blink(counts)
         
-    return result
+    return sum(counts.values())
 
 def main():
     """
@@ -80,10 +85,11 @@ def main():
         3. Otherwise, multiply by 2024
         
     Solution:
-        Uses memoization to cache results for each unique (stone, blinks) combination.  
-        Memoization is a technique where we store the results of expensive function calls and return the cached result 
-        when the same inputs occur again. Without memoization, we'd have to track every stone and do every transformation, 
-        leading to an exponential number of operations. With memoization, we only solve each unique subproblem once.
+        Tracks how many stones carry each value instead of tracking every stone.
+        The order of the stones never affects the count, and stones with the same value
+        always transform the same way, so each blink only has to transform each distinct
+        value once. Tracking every stone individually would lead to an exponential number
+        of operations, while the number of distinct values stays small.
     """
     stones = load_stones(Path(__file__).parent/"input.txt")
     
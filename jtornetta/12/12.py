@@ -1,102 +1,124 @@
 from pathlib import Path
-from typing import List, Set, Tuple, Dict
+from typing import Iterator, List, Tuple
 
-# Directions for movement: Left, Right, Up, Down
-DIRECTIONS = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+# Byte stored in the border around the map. It never matches a plant type, so the
+# border behaves like a neighboring region and no bounds checks are needed.
+EDGE = ord(".")
 
-def read_garden_map(file_path: Path) -> List[str]:
+def read_garden_map(file_path: Path) -> Tuple[bytes, int, int]:
     """
-    Returns garden map input as a list of strings.
+    Returns garden map input as one flat bytes object (indexed y * width + x),
+    along with its width and height. Plant types compare as plain byte values.
+    The map is surrounded by a one-cell border of EDGE bytes, included in the
+    width and height.
     """
-    grid = []
-    with file_path.open(encoding="utf-8") as file:
-        for line in file:
-            line = line.strip()
-            if line:
-                grid.append(line)
-    return grid
+    rows = file_path.read_bytes().split()
+    width = len(rows[0]) + 2
+    edge = bytes([EDGE])
+    padded_rows = [edge + row + edge for row in rows]
+    return edge * width + b"".join(padded_rows) + edge * width, width, len(rows) + 2
 
-def get_neighbors(position: Tuple[int, int], grid: List[str]) -> List[Tuple[Tuple[int, int], str]]:
+def map_cells(width: int, height: int) -> Iterator[int]:
     """
-    Returns the valid neighboring positions and their corresponding plant type.
+    Yields the flat indexes of the cells inside the border, row by row.
     """
-    x, y = position
-    neighbors = []
-    width, height = len(grid[0]), len(grid)
+    for row_start in range(width + 1, width * (height - 1), width):
+        yield from range(row_start, row_start + width - 2)
+
+def find_root(parent: List[int], index: int) -> int:
+    """
+    Returns the representative cell of the set containing index, halving the path on the way.
+    """
+    while parent[index] != index:
+        parent[index] = parent[parent[index]]
+        index = parent[index]
+    return index
+
+def label_regions(grid: bytes, width: int, height: int) -> List[int]:
+    """
+    Labels every cell with the region it belongs to using union-find.
     
-    for dx, dy in DIRECTIONS:
-        nx, ny = x + dx, y + dy
-        if 0 <= nx < width and 0 <= ny < height:
-            neighbors.append(((nx, ny), grid[ny][nx]))
-    return neighbors
+    Each cell is merged with its left and upper neighbors when they grow the same
+    plant, so a single pass over the grid connects every region. The label of a
+    cell is the flat index (y * width + x) of its region's representative cell.
+    Border cells are never merged, so each keeps a label of its own.
+    """
+    parent = list(range(width * height))
+
+    for index in map_cells(width, height):
+        plant_type = grid[index]
+        if grid[index - 1] == plant_type:
+            parent[find_root(parent, index)] = find_root(parent, index - 1)
+        if grid[index - width] == plant_type:
+            parent[find_root(parent, index)] = find_root(parent, index - width)
+
+    return [find_root(parent, index) for index in range(width * height)]
 
-def calculate_region_sides(region: Set[Tuple[int, int]]) -> int:
+def measure_regions(labels: List[int], width: int, height: int) -> Tuple[List[int], List[int]]:
     """
-    Calculates the number of distinct sides for a given region.
+    Computes the area and perimeter of every region from the cell labels.
+    
+    Returns two lists indexed by region label. Every side of a cell that faces a
+    cell with a different label, including a border cell, needs one fence.
+    """
+    area = [0] * (width * height)
+    perimeter = [0] * (width * height)
+
+    for index in map_cells(width, height):
+        label = labels[index]
+        area[label] += 1
+        perimeter[label] += ((labels[index - 1] != label) + (labels[index + 1] != label)
+                             + (labels[index - width] != label) + (labels[index + width] != label))
+
+    return area, perimeter
+
+def count_sides(labels: List[int], width: int, height: int) -> List[int]:
     """
-    up_sides = down_sides = left_sides = right_sides = 0
+    Counts the distinct sides of every region from the cell labels.
+    
+    A cell has an exposed edge in a direction when the neighbor that way has a
+    different label (border cells included). A side is a maximal straight run of
+    such edges, so it is counted once, at the cell where the run starts: the leftmost
+    cell of an up or down run, or the topmost cell of a left or right run.
     
-    for (x, y) in region:
-        left = (x - 1, y) not in region
-        right = (x + 1, y) not in region
-        above = (x, y - 1) not in region
-        below = (x, y + 1) not in region
-
-        # Check ownership of edges based on neighbors
-        if above and (right or (x + 1, y - 1) in region):
-            up_sides += 1
-        if below and (right or (x + 1, y + 1) in region):
-            down_sides += 1
-        if left and (below or (x - 1, y + 1) in region):
-            left_sides += 1
-        if right and (below or (x + 1, y + 1) in region):
-            right_sides += 1
-
-    return up_sides + down_sides + left_sides + right_sides
-
-def flood_fill_region(start_pos: Tuple[int, int], grid: List[str], visited: Set[Tuple[int, int]]) -> Tuple[int, int, int]:
-    """
-    Performs a flood-fill algorithm to find the area, perimeter, and sides of a region.
-    """
-    stack = [start_pos]
-    region = set()
-    area = perimeter = 0
-    plant_type = grid[start_pos[1]][start_pos[0]]
-
-    while stack:
-        x, y = stack.pop()
-        if (x, y) in region:
-            continue
-
-        region.add((x, y))
-        area += 1
-        local_sides = 4  # Each cell has 4 potential sides
-
-        for neighbor_pos, neighbor_type in get_neighbors((x, y), grid):
-            if neighbor_type == plant_type:
-                stack.append(neighbor_pos)
-                local_sides -= 1  # Neighbor reduces the perimeter
-        perimeter += local_sides
-
-    sides = calculate_region_sides(region)
-    visited.update(region)
-    return area, perimeter, sides
-
-def calculate_fencing_cost(grid: List[str], use_sides: bool = False) -> int:
+    Returns a list indexed by region label.
+    """
+    sides = [0] * (width * height)
+
+    for index in map_cells(width, height):
+        label = labels[index]
+        same_left = labels[index - 1] == label
+        same_above = labels[index - width] == label
+        up = not same_above
+        down = labels[index + width] != label
+        left = not same_left
+        right = labels[index + 1] != label
+
+        # A run continues from the previous cell if that cell is in the same region
+        # and has the same exposed edge
+        if same_left:
+            if up and labels[index - width - 1] != label:
+                up = False
+            if down and labels[index + width - 1] != label:
+                down = False
+        if same_above:
+            if left and labels[index - width - 1] != label:
+                left = False
+            if right and labels[index - width + 1] != label:
+                right = False
+
+        sides[label] += up + down + left + right
+
+    return sides
+
+def calculate_fencing_cost(grid: bytes, width: int, height: int, use_sides: bool = False) -> int:
     """
     Calculates the total cost of fencing all regions on the grid.
     """
-    visited = set()
-    total_cost = 0
-    width, height = len(grid[0]), len(grid)
-
-    for y in range(height):
-        for x in range(width):
-            if (x, y) not in visited:
-                area, perimeter, sides = flood_fill_region((x, y), grid, visited)
-                cost = area * (sides if use_sides else perimeter)
-                total_cost += cost
-    return total_cost
+    labels = label_regions(grid, width, height)
+    area, perimeter = measure_regions(labels, width, height)
+    fences = count_sides(labels, width, height) if use_sides else perimeter
+    return sum(a * f for a, f in zip(area, fences))
 
 def main():
     """
@@ -116,17 +138,18 @@ def main():
         - continuous straight lines count as one side
         
     Solution:
-        - Use flood-fill to identify regions and calculate their area, perimeter, and sides
+        - Use union-find to label every cell with its region in one pass over the grid
+        - Count area, perimeter, and sides per label in passes over the labeled grid
     """
     input_file = Path(__file__).parent / "input.txt"
-    garden_map = read_garden_map(input_file)
+    garden_map, width, height = read_garden_map(input_file)
 
     # Part 1: Total cost using area * perimeter
-    part1_cost = calculate_fencing_cost(garden_map, use_sides=False)
+    part1_cost = calculate_fencing_cost(garden_map, width, height, use_sides=False)
     print(f"Total price (Part 1): {part1_cost}")
 
     # Part 2: Total cost using area * sides
-    part2_cost = calculate_fencing_cost(garden_map, use_sides=True)
+    part2_cost = calculate_fencing_cost(garden_map, width, height, use_sides=True)
     print(f"Total price (Part 2): {part2_cost}")
 
 if __name__ == "__main__":
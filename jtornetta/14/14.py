@@ -1,72 +1,57 @@
+from collections import Counter
+from math import prod
 from pathlib import Path
-from typing import List, Tuple
+from typing import List, NamedTuple
+import re
 
 WIDTH = 101
 HEIGHT = 103
 
-class Robot:
-    def __init__(self, p_x: int, p_y: int, v_x: int, v_y: int):
-        """
-        Initialize a robot with its starting position (p_x, p_y) and velocity (v_x, v_y).
-        
-        Args:
-            p_x (int): The robot's initial x-coordinate.
-            p_y (int): The robot's initial y-coordinate.
-            v_x (int): The robot's x-velocity.
-            v_y (int): The robot's y-velocity.
-        """
-        self.p_x = p_x
-        self.p_y = p_y
-        self.v_x = v_x
-        self.v_y = v_y
-
-    def move(self, grid: List[int]) -> None:
-        """
-        Move the robot one step based on its velocity, wrapping around the grid edges.
-        Update the grid counter at the new position to track robot density.
-        
-        Args:
-            grid (List[int]): The grid representing the area where robots move.
-        """
-        self.p_x = (self.p_x + self.v_x) % WIDTH
-        self.p_y = (self.p_y + self.v_y) % HEIGHT
-        grid[self.p_y * WIDTH + self.p_x] += 1
-        
-    def get_position_at(self, time: int) -> Tuple[int, int]:
-        """
-        Calculate the robot's position at a specific future time without actually moving it.
-        Accounts for grid wrapping.
+# Every number in the input, in order: p_x, p_y, v_x, v_y for each robot
+NUMBER_PATTERN = re.compile(r"-?\d+")
+
+class Robots(NamedTuple):
+    """ Store every robot's initial position and velocity, one list per attribute """
+    p_x: List[int]
+    p_y: List[int]
+    v_x: List[int]
+    v_y: List[int]
+
+def build_cycle_table(positions: List[int], velocities: List[int], size: int) -> List[bytes]:
+    """
+    Tabulate every robot's coordinate along one axis for each second of that axis' cycle.
+    Coordinates along an axis repeat every size seconds, so this covers any time.
+    
+    Args:
+        positions (List[int]): Each robot's initial coordinate along the axis.
+        velocities (List[int]): Each robot's velocity along the axis.
+        size (int): The size of the grid along the axis, which is also the cycle length.
         
-        Args:
-            time (int): The number of seconds in the future to calculate the position for.
-            
-        Returns:
-            Tuple[int, int]: The robot's position (x, y) at the specified future time.
-        """
-        x = (self.p_x + (self.v_x * time)) % WIDTH
-        y = (self.p_y + (self.v_y * time)) % HEIGHT
-        return (x, y)
-
-def parse_input(filename: str) -> List[Robot]:
+    Returns:
+        List[bytes]: Row t holds every robot's coordinate at any second equal to t mod size.
+        Coordinates are below size, so each fits in one byte.
+    """
+    # Each row is the previous row advanced by one step, so no v * time products are needed
+    table = [bytes(positions)]
+    for _ in range(size - 1):
+        table.append(bytes([(c + v) % size for c, v in zip(table[-1], velocities)]))
+    return table
+
+def parse_input(filename: str) -> Robots:
     """
     Parse the input file containing each robot's initial position (p) and velocity (v).
-    Create and return a list of Robot objects based on the input data.
     
     Args:
         filename (str): The name of the input file containing robot data.
         
     Returns:
-        List[Robot]: A list of Robot objects initialized with the parsed input data.
+        Robots: The parsed positions and velocities, stored as one list per attribute
+        with the robots in input order.
     """
-    robots = []
     with open(filename, 'r') as file:
-        data = file.read().split("\n")
-    for row in data:
-        p_str, v_str = row.split(" ")
-        p_x, p_y = (int(val) for val in p_str[2:].split(","))
-        v_x, v_y = (int(val) for val in v_str[2:].split(","))
-        robots.append(Robot(p_x, p_y, v_x, v_y))
-    return robots
+        numbers = list(map(int, NUMBER_PATTERN.findall(file.read())))
+    # Every robot is four numbers in a row, so each attribute is every fourth number
+    return Robots(numbers[0::4], numbers[1::4], numbers[2::4], numbers[3::4])
 
 def print_grid(grid: List[int], width: int, height: int, seconds: int) -> None:
     """
@@ -79,78 +64,170 @@ def print_grid(grid: List[int], width: int, height: int, seconds: int) -> None:
         height (int): The height of the grid.
         seconds (int): The current time in seconds.
     """
-    rows = 0
-    cols = 0
+    # Build the whole picture first and print it at once instead of one cell at a time
+    lines = [
+        "".join(str(val) if val else " " for val in grid[row * width:(row + 1) * width])
+        for row in range(height)
+    ]
     print("Seconds", seconds)
-    for _ in range(width * height):
-        val = grid[width * rows + cols]
-        if val == 0:
-            val = " "
-        print(val, end="")
-        cols += 1
-        if cols == width:
-            print()
-            cols = 0
-            rows += 1
+    print("\n".join(lines))
     print("\n")
 
-def solve_part1(robots: List[Robot]) -> int:
+def solve_part1(x_table: List[bytes], y_table: List[bytes]) -> int:
     """
     Calculate the safety factor after 100 seconds based on the number of robots in each quadrant.
     Robots on the exact midlines are excluded from the count.
     
     Args:
-        robots (List[Robot]): The list of Robot objects representing the robots in the area.
+        x_table (List[bytes]): The x coordinates for each second of the WIDTH cycle.
+        y_table (List[bytes]): The y coordinates for each second of the HEIGHT cycle.
         
     Returns:
         int: The safety factor, which is the product of the robot counts in each quadrant.
     """
-    # Get positions at 100 seconds
-    positions = [robot.get_position_at(100) for robot in robots]
+    # Get positions at 100 seconds, as one column of x and one of y
+    xs, ys = x_table[100 % WIDTH], y_table[100 % HEIGHT]
     
-    # Count robots in each quadrant
+    # Count robots in each quadrant: 0 = TL, 1 = TR, 2 = BL, 3 = BR
+    # (bit 0 set for the right half, bit 1 set for the bottom half)
     mid_x = WIDTH // 2
     mid_y = HEIGHT // 2
-    quadrants = [0, 0, 0, 0]  # TL, TR, BL, BR
-    
-    for x, y in positions:
-        if x == mid_x or y == mid_y:
-            continue
-        quad_idx = (int(x > mid_x) + (2 * int(y > mid_y)))
-        quadrants[quad_idx] += 1
+    quadrants = Counter(
+        (x > mid_x) | (y > mid_y) << 1
+        for x, y in zip(xs, ys)
+        if x != mid_x and y != mid_y
+    )
     
     # Calculate safety factor
-    safety_factor = 1
-    for count in quadrants:
-        safety_factor *= count
-    return safety_factor
+    return prod(quadrants[quad_idx] for quad_idx in range(4))
+
+def cells_at(x_table: List[bytes], y_table: List[bytes], seconds: int) -> List[int]:
+    """
+    Look up every robot's cell at a specific time in the cycle tables.
+    
+    Args:
+        x_table (List[bytes]): The x coordinates for each second of the WIDTH cycle.
+        y_table (List[bytes]): The y coordinates for each second of the HEIGHT cycle.
+        seconds (int): The number of seconds elapsed.
+        
+    Returns:
+        List[int]: Each robot's cell, indexed as y * WIDTH + x.
+    """
+    return [y * WIDTH + x for x, y in zip(x_table[seconds % WIDTH], y_table[seconds % HEIGHT])]
 
-def solve_part2(robots:List[Robot]) -> int:
+def build_grid(x_table: List[bytes], y_table: List[bytes], seconds: int) -> List[int]:
+    """
+    Count how many robots stand on each cell of the grid at a specific time.
+    
+    Args:
+        x_table (List[bytes]): The x coordinates for each second of the WIDTH cycle.
+        y_table (List[bytes]): The y coordinates for each second of the HEIGHT cycle.
+        seconds (int): The number of seconds elapsed.
+        
+    Returns:
+        List[int]: Robot count per cell, indexed as y * WIDTH + x.
+    """
+    grid = [0] * (WIDTH * HEIGHT)
+    for cell in cells_at(x_table, y_table, seconds):
+        grid[cell] += 1
+    return grid
+
+def robots_overlap(x_table: List[bytes], y_table: List[bytes], seconds: int) -> bool:
+    """
+    Check whether any two robots stand on the same cell at a specific time.
+    
+    Args:
+        x_table (List[bytes]): The x coordinates for each second of the WIDTH cycle.
+        y_table (List[bytes]): The y coordinates for each second of the HEIGHT cycle.
+        seconds (int): The number of seconds elapsed.
+        
+    Returns:
+        bool: True if at least two robots share a cell.
+    """
+    # Stop at the first collision instead of placing every robot; most seconds
+    # have one early on.
+    occupied = set()
+    for x, y in zip(x_table[seconds % WIDTH], y_table[seconds % HEIGHT]):
+        cell = y * WIDTH + x
+        if cell in occupied:
+            return True
+        occupied.add(cell)
+    return False
+
+def tightest_time(table: List[bytes]) -> int:
+    """
+    Find the second, within one cycle along a single axis, at which the robots are bunched
+    closest together along that axis, i.e. their coordinates have the smallest variance.
+    
+    Args:
+        table (List[bytes]): The coordinates along the axis for each second of its cycle.
+        
+    Returns:
+        int: The row of the table with the smallest spread of coordinates.
+    """
+    best_time, best_spread = 0, None
+    for time, coords in enumerate(table):
+        # count^2 times the variance, kept in integers
+        spread = len(coords) * sum(c * c for c in coords) - sum(coords) ** 2
+        if best_spread is None or spread < best_spread:
+            best_time, best_spread = time, spread
+    return best_time
+
+def scan_for_tree(x_table: List[bytes], y_table: List[bytes]) -> int:
+    """
+    Find the first second at which no two robots overlap, by checking every second of one cycle.
+    
+    Args:
+        x_table (List[bytes]): The x coordinates for each second of the WIDTH cycle.
+        y_table (List[bytes]): The y coordinates for each second of the HEIGHT cycle.
+        
+    Returns:
+        int: The first second at which every robot stands on its own cell.
+    """
+    # Every x repeats after WIDTH seconds and every y after HEIGHT seconds, so the
+    # whole arrangement repeats after WIDTH * HEIGHT seconds (both are prime).
+    for seconds in range(1, WIDTH * HEIGHT + 1):
+        if robots_overlap(x_table, y_table, seconds):
+            if seconds % 1000 == 0:
+                print(f"Checking second {seconds}...")
+            continue
+        return seconds
+    raise ValueError("No tree pattern found within one full cycle")
+
+def solve_part2(x_table: List[bytes], y_table: List[bytes]) -> int:
     """
     Determines the fewest number of seconds that must elapse for the easter egg to appear.
     This was hard and I didn't know what I was looking for. The first solution I printed out everything
     and manually reviewed to find the easter egg. Once I knew what to look for, I realized I could look
     for non-overlapping robots. I think I got lucky with this solution overall.
 
+    The tree packs most robots into a small box, so the x coordinates are bunched tightest
+    at that second (mod WIDTH) and the y coordinates too (mod HEIGHT). The x and y motions
+    are independent, so each axis is searched on its own and the two seconds are combined
+    with the Chinese Remainder Theorem. Checking for non-overlapping robots is kept only
+    to confirm the result, with a full scan as a fallback.
+    
+    The coordinates along each axis are tabulated once for one cycle (WIDTH seconds for x,
+    HEIGHT seconds for y), so every lookup is a table read.
+
     Args:
-        robots (List[Robot]): The list of Robot objects representing the robots in the area.
+        x_table (List[bytes]): The x coordinates for each second of the WIDTH cycle.
+        y_table (List[bytes]): The y coordinates for each second of the HEIGHT cycle.
         
     Returns:
         int: The least number of seconds to elapse for the tree to appear
     """
-    seconds = 0
     print("\nSearching for tree pattern...")
-    while True:
-        grid = [0 for i in range(WIDTH * HEIGHT)]
-        for robot in robots:
-            robot.move(grid)
-        seconds += 1
-        if max(grid) > 1:
-            if seconds % 1000 == 0:
-                print(f"Checking second {seconds}...")
-            continue
-        print_grid(grid, WIDTH, HEIGHT, seconds)
-        break
+    time_x = tightest_time(x_table)
+    time_y = tightest_time(y_table)
+    
+    # Solve seconds = time_x (mod WIDTH) and seconds = time_y (mod HEIGHT)
+    seconds = (time_x * HEIGHT * pow(HEIGHT, -1, WIDTH)
+               + time_y * WIDTH * pow(WIDTH, -1, HEIGHT)) % (WIDTH * HEIGHT)
+    
+    if robots_overlap(x_table, y_table, seconds):
+        seconds = scan_for_tree(x_table, y_table)
+    print_grid(build_grid(x_table, y_table, seconds), WIDTH, HEIGHT, seconds)
     return seconds
 
 def main():
@@ -161,13 +238,17 @@ def main():
     """
     # Parse input
     robots = parse_input(Path(__file__).parent/'input.txt')
+    
+    # Both parts read positions from the same per-axis cycle tables
+    x_table = build_cycle_table(robots.p_x, robots.v_x, WIDTH)
+    y_table = build_cycle_table(robots.p_y, robots.v_y, HEIGHT)
 
     # Part 1
-    safety_factor = solve_part1(robots)
+    safety_factor = solve_part1(x_table, y_table)
     print(f"Part 1: {safety_factor}")  # Should be 224357412
 
     # Part 2
-    easter_egg = solve_part2(robots)
+    easter_egg = solve_part2(x_table, y_table)
     print("Easter egg found after", easter_egg, "seconds")
 
 if __name__ == "__main__":